@@ -3,7 +3,7 @@ import logging
 
 from homeassistant import config_entries
 from homeassistant.core import callback
-from homeassistant.helpers.aiohttp_client import async_create_clientsession
+from homeassistant.helpers.aiohttp_client import async_get_clientsession
 from imouapi.api import ImouAPIClient
 from imouapi.device import ImouDevice, ImouDiscoverService
 from imouapi.exceptions import ImouException
@@ -29,6 +29,23 @@ from .const import (
 
 _LOGGER: logging.Logger = logging.getLogger(__package__)
 
+# static schemas, built once at module load
+_LOGIN_SCHEMA = vol.Schema(
+    {
+        vol.Required(CONF_API_URL, default=DEFAULT_API_URL): str,
+        vol.Required(CONF_APP_ID): str,
+        vol.Required(CONF_APP_SECRET): str,
+        vol.Required(CONF_ENABLE_DISCOVER, default=True): bool,
+    }
+)
+_DISCOVER_SCHEMA_BASE = {vol.Optional(CONF_DEVICE_NAME): str}
+_MANUAL_SCHEMA = vol.Schema(
+    {
+        vol.Required(CONF_DEVICE_ID): str,
+        vol.Optional(CONF_DEVICE_NAME): str,
+    }
+)
+
 
 class ImouFlowHandler(config_entries.ConfigFlow, domain=DOMAIN):
     """Config flow for imou."""
@@ -44,12 +61,12 @@ class ImouFlowHandler(config_entries.ConfigFlow, domain=DOMAIN):
         self._api_client = None
         self._discover_service = None
         self._session = None
+        self._creds_key = None
         self._discovered_devices = {}
         self._errors = {}
 
     async def async_step_user(self, user_input=None):
         """Handle a flow initialized by the user."""
-        self._session = async_create_clientsession(self.hass)
         return await self.async_step_login()
 
     # Step: login
@@ -57,20 +74,36 @@ class ImouFlowHandler(config_entries.ConfigFlow, domain=DOMAIN):
         """Ask and validate app id and app secret."""
         self._errors = {}
         if user_input is not None:
-            # create an imou discovery service
-            self._api_client = ImouAPIClient(
-                user_input[CONF_APP_ID], user_input[CONF_APP_SECRET], self._session
+            # get the session only when credentials are submitted
+            if self._session is None:
+                self._session = async_get_clientsession(self.hass)
+            key = (
+                user_input[CONF_API_URL],
+                user_input[CONF_APP_ID],
+                user_input[CONF_APP_SECRET],
             )
-            self._api_client.set_base_url(user_input[CONF_API_URL])
-            self._discover_service = ImouDiscoverService(self._api_client)
-            valid = False
-            # check if the provided credentails are working
-            try:
-                await self._api_client.async_connect()
-                valid = True
-            except ImouException as exception:
-                self._errors["base"] = exception.get_title()
-                _LOGGER.error(exception.to_string())
+            # reuse the discovery service if the credentials are unchanged
+            valid = key == self._creds_key and self._discover_service is not None
+            if not valid:
+                # invalidate the cache before replacing the client so a failed
+                # connect cannot leave a stale key behind
+                self._creds_key = None
+                # create an imou discovery service
+                self._api_client = ImouAPIClient(
+                    user_input[CONF_APP_ID], user_input[CONF_APP_SECRET], self._session
+                )
+                self._api_client.set_base_url(user_input[CONF_API_URL])
+                self._discover_service = ImouDiscoverService(self._api_client)
+                # check if the provided credentails are working
+                try:
+                    await self._api_client.async_connect()
+                    self._creds_key = key
+                    # devices discovered with other credentials are stale
+                    self._discovered_devices = {}
+                    valid = True
+                except ImouException as exception:
+                    self._errors["base"] = exception.get_title()
+                    _LOGGER.error(exception.to_string())
             # valid credentials provided
             if valid:
                 # store app id and secret for later steps
@@ -86,17 +119,26 @@ class ImouFlowHandler(config_entries.ConfigFlow, domain=DOMAIN):
         # by default show up the form
         return self.async_show_form(
             step_id="login",
-            data_schema=vol.Schema(
-                {
-                    vol.Required(CONF_API_URL, default=DEFAULT_API_URL): str,
-                    vol.Required(CONF_APP_ID): str,
-                    vol.Required(CONF_APP_SECRET): str,
-                    vol.Required(CONF_ENABLE_DISCOVER, default=True): bool,
-                }
-            ),
+            data_schema=_LOGIN_SCHEMA,
             errors=self._errors,
         )
 
+    async def _finalize_entry(self, device, user_input, device_id):
+        """Create the config entry for a discovered or manually added device."""
+        # set the name, falling back to the device name if none was provided
+        name = user_input.get(CONF_DEVICE_NAME) or device.get_name()
+        await self.async_set_unique_id(device_id)
+        return self.async_create_entry(
+            title=name,
+            data={
+                CONF_API_URL: self._api_url,
+                CONF_DEVICE_NAME: name,
+                CONF_APP_ID: self._app_id,
+                CONF_APP_SECRET: self._app_secret,
+                CONF_DEVICE_ID: device_id,
+            },
+        )
+
     # Step: discover
 
     async def async_step_discover(self, user_input=None):
@@ -106,32 +148,22 @@ class ImouFlowHandler(config_entries.ConfigFlow, domain=DOMAIN):
             # get the device instance from the selected input
             device = self._discovered_devices[user_input[CONF_DISCOVERED_DEVICE]]
             if device is not None:
-                # set the name
-                name = (
-                    f"{user_input[CONF_DEVICE_NAME]}"
-                    if CONF_DEVICE_NAME in user_input
-                    and user_input[CONF_DEVICE_NAME] != ""
-                    else device.get_name()
+                return await self._finalize_entry(
+                    device, user_input, device.get_device_id()
                 )
-                # create the entry
-                data = {
-                    CONF_API_URL: self._api_url,
-                    CONF_DEVICE_NAME: name,
-                    CONF_APP_ID: self._app_id,
-                    CONF_APP_SECRET: self._app_secret,
-                    CONF_DEVICE_ID: device.get_device_id(),
-                }
-                await self.async_set_unique_id(device.get_device_id())
-                return self.async_create_entry(title=name, data=data)
 
-        # discover registered devices
-        try:
-            self._discovered_devices = (
-                await self._discover_service.async_discover_devices()
-            )
-        except ImouException as exception:
-            self._errors["base"] = exception.get_title()
-            _LOGGER.error(exception.to_string())
+        # discover registered devices (unless already discovered)
+        if not self._discovered_devices:
+            try:
+                self._discovered_devices = (
+                    await self._discover_service.async_discover_devices()
+                )
+            except ImouException as exception:
+                self._errors["base"] = exception.get_title()
+                _LOGGER.error(exception.to_string())
+        # no registered device to pick from, fall back to manual configuration
+        if not self._discovered_devices and not self._errors:
+            return await self.async_step_manual()
         return self.async_show_form(
             step_id="discover",
             data_schema=vol.Schema(
@@ -139,7 +171,7 @@ class ImouFlowHandler(config_entries.ConfigFlow, domain=DOMAIN):
                     vol.Required(CONF_DISCOVERED_DEVICE): vol.In(
                         self._discovered_devices.keys()
                     ),
-                    vol.Optional(CONF_DEVICE_NAME): str,
+                    **_DISCOVER_SCHEMA_BASE,
                 }
             ),
             errors=self._errors,
@@ -163,33 +195,14 @@ class ImouFlowHandler(config_entries.ConfigFlow, domain=DOMAIN):
                 _LOGGER.error(exception.to_string())
             # valid credentials provided, create the entry
             if valid:
-                # set the name
-                name = (
-                    f"{user_input[CONF_DEVICE_NAME]}"
-                    if CONF_DEVICE_NAME in user_input
-                    and user_input[CONF_DEVICE_NAME] != ""
-                    else device.get_name()
+                return await self._finalize_entry(
+                    device, user_input, user_input[CONF_DEVICE_ID]
                 )
-                # create the entry
-                data = {
-                    CONF_API_URL: self._api_url,
-                    CONF_DEVICE_NAME: name,
-                    CONF_APP_ID: self._app_id,
-                    CONF_APP_SECRET: self._app_secret,
-                    CONF_DEVICE_ID: user_input[CONF_DEVICE_ID],
-                }
-                await self.async_set_unique_id(user_input[CONF_DEVICE_ID])
-                return self.async_create_entry(title=name, data=data)
 
         # by default show up the form
         return self.async_show_form(
             step_id="manual",
-            data_schema=vol.Schema(
-                {
-                    vol.Required(CONF_DEVICE_ID): str,
-                    vol.Optional(CONF_DEVICE_NAME): str,
-                }
-            ),
+            data_schema=_MANUAL_SCHEMA,
             errors=self._errors,
         )
 
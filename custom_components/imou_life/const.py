@@ -32,18 +32,20 @@ DEFAULT_SCAN_INTERVAL = 15 * 60
 DEFAULT_API_URL = "https://openapi.easy4ip.com/openapi"
 
 # switches which are enabled by default
-ENABLED_SWITCHES = [
-    "motionDetect",
-    "headerDetect",
-    "abAlarmSound",
-    "breathingLight",
-    "closeCamera",
-    "linkDevAlarm",
-    "whiteLight",
-    "smartTrack",
-    "linkagewhitelight",
-    "pushNotifications",
-]
+ENABLED_SWITCHES = frozenset(
+    {
+        "motionDetect",
+        "headerDetect",
+        "abAlarmSound",
+        "breathingLight",
+        "closeCamera",
+        "linkDevAlarm",
+        "whiteLight",
+        "smartTrack",
+        "linkagewhitelight",
+        "pushNotifications",
+    }
+)
 
 # cameras which are enabled by default
 ENABLED_CAMERAS = [
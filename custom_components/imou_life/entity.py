@@ -13,6 +13,10 @@ _LOGGER: logging.Logger = logging.getLogger(__package__)
 class ImouEntity(CoordinatorEntity):
     """imou entity class."""
 
+    # slots give faster attribute access for these names; instances still
+    # carry a __dict__ since the HA base classes are unslotted
+    __slots__ = ("config_entry", "device", "sensor_instance", "entity_available")
+
     def __init__(self, coordinator, config_entry, sensor_instance, entity_format):
         """Initialize."""
         super().__init__(coordinator)
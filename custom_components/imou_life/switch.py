@@ -19,24 +19,32 @@ async def async_setup_entry(
     """Configure platform."""
     coordinator = hass.data[DOMAIN][entry.entry_id]
     device = coordinator.device
-    sensors = []
-    for sensor_instance in device.get_sensors_by_platform("switch"):
-        sensor = ImouSwitch(coordinator, entry, sensor_instance, ENTITY_ID_FORMAT)
-        sensors.append(sensor)
-        coordinator.entities.append(sensor)
-        _LOGGER.debug(
-            "[%s] Adding %s", device.get_name(), sensor_instance.get_description()
-        )
-    async_add_devices(sensors)
+    device_name = device.get_name()
+    debug = _LOGGER.isEnabledFor(logging.DEBUG)
+
+    def _entities():
+        for sensor_instance in device.get_sensors_by_platform("switch"):
+            sensor = ImouSwitch(coordinator, entry, sensor_instance, ENTITY_ID_FORMAT)
+            # resolve once at setup instead of on every registry access
+            sensor._attr_entity_registry_enabled_default = (
+                sensor_instance.get_name() in ENABLED_SWITCHES
+            )
+            coordinator.entities.append(sensor)
+            if debug:
+                _LOGGER.debug(
+                    "[%s] Adding %s",
+                    device_name,
+                    sensor_instance.get_description(),
+                )
+            yield sensor
+
+    async_add_devices(_entities())
 
 
 class ImouSwitch(ImouEntity, SwitchEntity):
     """imou switch class."""
 
-    @property
-    def entity_registry_enabled_default(self) -> bool:
-        """If the entity is enabled by default."""
-        return self.sensor_instance.get_name() in ENABLED_SWITCHES
+    __slots__ = ()
 
     @property
     def is_on(self):
@@ -45,6 +53,7 @@ class ImouSwitch(ImouEntity, SwitchEntity):
 
     async def async_turn_on(self, **kwargs):  # pylint: disable=unused-argument
         """Turn on the switch."""
+        was_on = self.sensor_instance.is_on()
         # pushNotifications switch
         if self.sensor_instance.get_name() == "pushNotifications":
             callback_url = None
@@ -62,7 +71,9 @@ class ImouSwitch(ImouEntity, SwitchEntity):
         else:
             await self.sensor_instance.async_turn_on()
         # save the new state to the state machine (otherwise will be reset by HA and set to the correct value only upon the next update)
-        self.async_write_ha_state()
+        # skip the write (and the event bus fan-out) if the state did not change
+        if self.sensor_instance.is_on() != was_on:
+            self.async_write_ha_state()
         _LOGGER.debug(
             "[%s] Turned %s ON",
             self.device.get_name(),
@@ -71,10 +82,13 @@ class ImouSwitch(ImouEntity, SwitchEntity):
 
     async def async_turn_off(self, **kwargs):  # pylint: disable=unused-argument
         """Turn off the switch."""
+        was_on = self.sensor_instance.is_on()
         # control the switch
         await self.sensor_instance.async_turn_off()
         # save the new state to the state machine (otherwise will be reset by HA and set to the correct value only upon the next update)
-        self.async_write_ha_state()
+        # skip the write (and the event bus fan-out) if the state did not change
+        if self.sensor_instance.is_on() != was_on:
+            self.async_write_ha_state()
         _LOGGER.debug(
             "[%s] Turned %s OFF",
             self.device.get_name(),
@@ -83,9 +97,12 @@ class ImouSwitch(ImouEntity, SwitchEntity):
 
     async def async_toggle(self, **kwargs):  # pylint: disable=unused-argument
         """Toggle the switch."""
+        was_on = self.sensor_instance.is_on()
         await self.sensor_instance.async_toggle()
         # save the new state to the state machine (otherwise will be reset by HA and set to the correct value only upon the next update)
-        self.async_write_ha_state()
+        # skip the write (and the event bus fan-out) if the state did not change
+        if self.sensor_instance.is_on() != was_on:
+            self.async_write_ha_state()
         _LOGGER.debug(
             "[%s] Toggled",
             self.device.get_name(),
@@ -2,6 +2,8 @@
 from unittest.mock import patch
 
 from homeassistant import config_entries, data_entry_flow
+from imouapi.device import ImouDevice
+from imouapi.exceptions import ImouException
 import pytest
 from pytest_homeassistant_custom_component.common import MockConfigEntry
 
@@ -77,6 +79,69 @@ async def test_discover_ok(hass, api_ok):
     assert result["result"]
 
 
+@pytest.mark.asyncio
+async def test_discover_runs_once(hass, api_ok):
+    """Test discover flow: discovery is not repeated when the form is redisplayed."""
+    with patch(
+        "imouapi.device.ImouDiscoverService.async_discover_devices",
+        return_value={"device_id": ImouDevice(None, None)},
+    ) as discover_func:
+        result = await hass.config_entries.flow.async_init(
+            DOMAIN, context={"source": config_entries.SOURCE_USER}
+        )
+        # login, landing on the discover form (first and only discovery call)
+        result = await hass.config_entries.flow.async_configure(
+            result["flow_id"], user_input=MOCK_LOGIN_WITH_DISCOVER
+        )
+        assert result["step_id"] == "discover"
+        # redisplay the discover form
+        result = await hass.config_entries.flow.async_configure(
+            result["flow_id"], user_input=None
+        )
+        assert result["step_id"] == "discover"
+    # ensure the cached devices were reused on the redisplay
+    assert len(discover_func.mock_calls) == 1
+
+
+@pytest.mark.asyncio
+async def test_discover_no_devices(hass, api_ok):
+    """Test discover flow: fall back to manual setup when no device is found."""
+    with patch(
+        "imouapi.device.ImouDiscoverService.async_discover_devices",
+        return_value={},
+    ):
+        result = await hass.config_entries.flow.async_init(
+            DOMAIN, context={"source": config_entries.SOURCE_USER}
+        )
+        result = await hass.config_entries.flow.async_configure(
+            result["flow_id"], user_input=MOCK_LOGIN_WITH_DISCOVER
+        )
+    # ensure the user lands on the manual form instead of an empty discover form
+    assert result["type"] == data_entry_flow.RESULT_TYPE_FORM
+    assert result["step_id"] == "manual"
+
+
+@pytest.mark.asyncio
+async def test_discover_error(hass, api_ok):
+    """Test discover flow: discovery error stays on the discover form."""
+    with patch(
+        "imouapi.exceptions.ImouException.get_title",
+        return_value="invalid_configuration",
+    ), patch(
+        "imouapi.device.ImouDiscoverService.async_discover_devices",
+        side_effect=ImouException(),
+    ):
+        result = await hass.config_entries.flow.async_init(
+            DOMAIN, context={"source": config_entries.SOURCE_USER}
+        )
+        result = await hass.config_entries.flow.async_configure(
+            result["flow_id"], user_input=MOCK_LOGIN_WITH_DISCOVER
+        )
+    assert result["type"] == data_entry_flow.RESULT_TYPE_FORM
+    assert result["step_id"] == "discover"
+    assert result["errors"] == {"base": "invalid_configuration"}
+
+
 @pytest.mark.asyncio
 async def test_login_error(hass, api_invalid_app_id):
     """Test config flow: invalid app id."""
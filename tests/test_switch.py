@@ -2,7 +2,7 @@
 from unittest.mock import patch
 
 from homeassistant.components.switch import SERVICE_TURN_OFF, SERVICE_TURN_ON
-from homeassistant.const import ATTR_ENTITY_ID
+from homeassistant.const import ATTR_ENTITY_ID, STATE_ON
 import pytest
 from pytest_homeassistant_custom_component.common import MockConfigEntry
 
@@ -69,3 +69,72 @@ async def test_switch(hass, api_ok):
             blocking=True,
         )
     assert turn_off_func.called
+
+
+@pytest.mark.asyncio
+async def test_switch_writes_state_on_transition(hass, api_ok):
+    """Test that an off->on transition is written to the state machine."""
+    config_entry = MockConfigEntry(
+        domain=DOMAIN, data=MOCK_CONFIG_ENTRY, entry_id="test"
+    )
+    assert await async_setup_entry(hass, config_entry)
+    await hass.async_block_till_done()
+    with patch(
+        "custom_components.imou_life.switch.ImouSwitch.entity_registry_enabled_default",
+        return_value=True,
+    ), patch(
+        "custom_components.imou_life.entity.ImouEntity.available",
+        return_value=True,
+    ), patch(
+        "imouapi.device_entity.ImouSwitch.is_on"
+    ) as is_on_func, patch(
+        "imouapi.device_entity.ImouSwitch.async_turn_on"
+    ) as turn_on_func:
+        # the switch is off and turns on once the command is sent
+        is_on_func.return_value = False
+        turn_on_func.side_effect = lambda *args, **kwargs: setattr(
+            is_on_func, "return_value", True
+        )
+        await hass.services.async_call(
+            "switch",
+            SERVICE_TURN_ON,
+            service_data={ATTR_ENTITY_ID: "switch.device_name_motiondetect"},
+            blocking=True,
+        )
+        assert turn_on_func.called
+        # ensure the new state has been written to the state machine
+        assert hass.states.get("switch.device_name_motiondetect").state == STATE_ON
+
+
+@pytest.mark.asyncio
+async def test_switch_skips_write_on_noop(hass, api_ok):
+    """Test that no state write happens when the state does not change."""
+    config_entry = MockConfigEntry(
+        domain=DOMAIN, data=MOCK_CONFIG_ENTRY, entry_id="test"
+    )
+    assert await async_setup_entry(hass, config_entry)
+    await hass.async_block_till_done()
+    with patch(
+        "custom_components.imou_life.switch.ImouSwitch.entity_registry_enabled_default",
+        return_value=True,
+    ), patch(
+        "custom_components.imou_life.entity.ImouEntity.available",
+        return_value=True,
+    ), patch(
+        # the switch is already on, turning it on again is a no-op
+        "imouapi.device_entity.ImouSwitch.is_on",
+        return_value=True,
+    ), patch(
+        "imouapi.device_entity.ImouSwitch.async_turn_on"
+    ) as turn_on_func, patch(
+        "custom_components.imou_life.switch.ImouSwitch.async_write_ha_state"
+    ) as write_func:
+        await hass.services.async_call(
+            "switch",
+            SERVICE_TURN_ON,
+            service_data={ATTR_ENTITY_ID: "switch.device_name_motiondetect"},
+            blocking=True,
+        )
+    # the command is still sent but the state machine is left alone
+    assert turn_on_func.called
+    assert not write_func.called